@@ -8,27 +8,35 @@ from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 import streamlit as st
 
-def create_calendar_event(event_row: pd.Series) -> dict:
-    """Create a Google Calendar event dictionary from a DataFrame row"""
+def _event_summary(event_row) -> str:
+    """Pick a display name for an event row (Series or dict)"""
+    for col in ['scraped_event', 'calendar_event']:
+        value = event_row.get(col)
+        if pd.notna(value) and value:
+            return value
+    return 'Untitled Event'
+
+def create_calendar_event(summary: str, description: str, location: str,
+                          start_dt, end_dt) -> dict:
+    """Create a Google Calendar event dictionary from pre-parsed fields.
+
+    start_dt/end_dt are already-parsed timestamps so callers can batch the
+    expensive pd.to_datetime over the whole frame instead of per event.
+    """
+    if pd.isna(start_dt):
+        return None
+
     event = {
-        'summary': event_row.get('scraped_event') or event_row.get('calendar_event', 'Untitled Event'),
-        'description': event_row.get('description', ''),
-        'location': event_row.get('location', ''),
-    }
-    
-    # Add start time
-    if pd.notna(event_row.get('start')):
-        start_dt = pd.to_datetime(event_row['start'])
-        event['start'] = {
+        'summary': summary,
+        'description': description,
+        'location': location,
+        'start': {
             'dateTime': start_dt.isoformat(),
             'timeZone': 'America/New_York'
-        }
-    else:
-        return None
-    
-    # Add end time
-    if pd.notna(event_row.get('end')):
-        end_dt = pd.to_datetime(event_row['end'])
+        },
+    }
+
+    if pd.notna(end_dt):
         event['end'] = {
             'dateTime': end_dt.isoformat(),
             'timeZone': 'America/New_York'
@@ -39,33 +47,91 @@ def create_calendar_event(event_row: pd.Series) -> dict:
             'dateTime': (start_dt + pd.Timedelta(hours=1)).isoformat(),
             'timeZone': 'America/New_York'
         }
-    
+
     return event
 
-def add_events_to_calendar(creds: Credentials, events_df: pd.DataFrame, 
+BATCH_SIZE = 50  # Google Calendar API allows up to 50 requests per batch
+
+def add_events_to_calendar(creds: Credentials, events_df: pd.DataFrame,
                           calendar_id: str = 'primary') -> dict:
-    """Add multiple events to Google Calendar"""
+    """Add multiple events to Google Calendar using batched API requests"""
     service = build('calendar', 'v3', credentials=creds)
-    
+
     results = {
         'success': [],
         'failed': [],
         'total': len(events_df)
     }
-    
-    for idx, row in events_df.iterrows():
+
+    # Track the event summary for each queued request so the batch callback
+    # can report failures by name
+    pending_events = {}
+
+    def handle_batch_response(request_id, response, exception):
+        event_name = pending_events.pop(request_id, 'Unknown')
+        if exception is not None:
+            results['failed'].append({
+                'event': event_name,
+                'reason': str(exception)
+            })
+        else:
+            results['success'].append({
+                'event': event_name,
+                'id': response.get('id')
+            })
+
+    def execute_batch(batch):
+        """Run one batch; a transport-level failure marks every event still
+        awaiting a callback as failed instead of raising out of the export"""
         try:
-            event = create_calendar_event(row)
-            if event:
-                created_event = service.events().insert(
-                    calendarId=calendar_id,
-                    body=event
-                ).execute()
-                
-                results['success'].append({
-                    'event': event['summary'],
-                    'id': created_event.get('id')
+            batch.execute()
+        except Exception as e:
+            for event_name in pending_events.values():
+                results['failed'].append({
+                    'event': event_name,
+                    'reason': str(e)
                 })
+            pending_events.clear()
+
+    # One batch request replaces up to BATCH_SIZE HTTP round-trips
+    batch = service.new_batch_http_request(callback=handle_batch_response)
+    queued = 0
+
+    # Parse the datetime columns once for the whole frame instead of a
+    # scalar pd.to_datetime pair per event
+    if 'start' in events_df.columns:
+        start_dts = pd.to_datetime(events_df['start'], errors='coerce')
+    else:
+        start_dts = pd.Series(pd.NaT, index=events_df.index)
+    if 'end' in events_df.columns:
+        end_dts = pd.to_datetime(events_df['end'], errors='coerce')
+    else:
+        end_dts = pd.Series(pd.NaT, index=events_df.index)
+
+    # Iterate plain dicts instead of iterrows to skip per-row Series construction
+    rows = zip(events_df.to_dict('records'), start_dts, end_dts)
+    for i, (row, start_dt, end_dt) in enumerate(rows):
+        try:
+            event = create_calendar_event(
+                _event_summary(row),
+                row.get('description', ''),
+                row.get('location', ''),
+                start_dt,
+                end_dt
+            )
+            if event:
+                request_id = str(i)
+                pending_events[request_id] = event['summary']
+                batch.add(
+                    service.events().insert(calendarId=calendar_id, body=event),
+                    request_id=request_id
+                )
+                queued += 1
+
+                if queued >= BATCH_SIZE:
+                    execute_batch(batch)
+                    batch = service.new_batch_http_request(callback=handle_batch_response)
+                    queued = 0
             else:
                 results['failed'].append({
                     'event': row.get('scraped_event') or row.get('calendar_event', 'Unknown'),
@@ -76,38 +142,80 @@ def add_events_to_calendar(creds: Credentials, events_df: pd.DataFrame,
                 'event': row.get('scraped_event') or row.get('calendar_event', 'Unknown'),
                 'reason': str(e)
             })
-    
+
+    # Flush any remaining queued inserts
+    if queued:
+        execute_batch(batch)
+
     return results
 
 def generate_ical_file(events_df: pd.DataFrame) -> str:
     """Generate an iCal file for download"""
-    ical_content = "BEGIN:VCALENDAR\n"
-    ical_content += "VERSION:2.0\n"
-    ical_content += "PRODID:-//Fit-Tartans//Fitness Scheduler//EN\n"
-    ical_content += "CALSCALE:GREGORIAN\n"
-    ical_content += "METHOD:PUBLISH\n"
-    
-    for _, row in events_df.iterrows():
-        event_name = row.get('scraped_event') or row.get('calendar_event', 'Untitled Event')
-        description = row.get('description', '')
-        location = row.get('location', '')
-        
-        if pd.notna(row.get('start')):
-            start_dt = pd.to_datetime(row['start'])
-            end_dt = pd.to_datetime(row.get('end', start_dt + pd.Timedelta(hours=1)))
-            
-            # Format for iCal (UTC)
-            start_str = start_dt.strftime('%Y%m%dT%H%M%SZ')
-            end_str = end_dt.strftime('%Y%m%dT%H%M%SZ')
-            
-            ical_content += "BEGIN:VEVENT\n"
-            ical_content += f"DTSTART:{start_str}\n"
-            ical_content += f"DTEND:{end_str}\n"
-            ical_content += f"SUMMARY:{event_name}\n"
-            ical_content += f"DESCRIPTION:{description}\n"
-            ical_content += f"LOCATION:{location}\n"
-            ical_content += "END:VEVENT\n"
-    
-    ical_content += "END:VCALENDAR\n"
-    return ical_content
+    # Collect lines in a list and join once at the end — repeated str +=
+    # copies the whole buffer each time (O(n^2) in output size)
+    parts = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Fit-Tartans//Fitness Scheduler//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+    ]
+
+    if events_df.empty or 'start' not in events_df.columns:
+        parts.append("END:VCALENDAR")
+        return '\n'.join(parts) + '\n'
+
+    # Parse and format the datetime columns once, vectorized, instead of
+    # per-row to_datetime/strftime calls inside the loop
+    starts = pd.to_datetime(events_df['start'], errors='coerce')
+    if 'end' in events_df.columns:
+        ends = pd.to_datetime(events_df['end'], errors='coerce')
+        ends = ends.fillna(starts + pd.Timedelta(hours=1))
+    else:
+        # Default to 1 hour if no end time
+        ends = starts + pd.Timedelta(hours=1)
+    start_strs = starts.dt.strftime('%Y%m%dT%H%M%SZ')
+    end_strs = ends.dt.strftime('%Y%m%dT%H%M%SZ')
+
+    names = pd.Series('', index=events_df.index)
+    for col in ['scraped_event', 'calendar_event']:
+        if col in events_df.columns:
+            names = names.where(names.ne(''), events_df[col].fillna(''))
+    names = names.replace('', 'Untitled Event')
+
+    def text_column(col):
+        if col in events_df.columns:
+            return events_df[col].fillna('')
+        return pd.Series('', index=events_df.index)
+
+    # Escape iCal TEXT special characters (RFC 5545) column-wide — each
+    # chained replace is one C-level pass instead of per-row Python replaces
+    def escape_ical(series):
+        return (series.astype(str)
+                .str.replace('\\', '\\\\', regex=False)
+                .str.replace(';', '\\;', regex=False)
+                .str.replace(',', '\\,', regex=False)
+                .str.replace('\n', '\\n', regex=False))
+
+    names = escape_ical(names)
+    descriptions = escape_ical(text_column('description'))
+    locations = escape_ical(text_column('location'))
+
+    # itertuples over plain columns avoids materializing a Series per row
+    rows = zip(starts.notna(), start_strs, end_strs, names, descriptions, locations)
+
+    for has_start, start_str, end_str, event_name, description, location in rows:
+        if has_start:
+            parts.extend([
+                "BEGIN:VEVENT",
+                f"DTSTART:{start_str}",
+                f"DTEND:{end_str}",
+                f"SUMMARY:{event_name}",
+                f"DESCRIPTION:{description}",
+                f"LOCATION:{location}",
+                "END:VEVENT",
+            ])
+
+    parts.append("END:VCALENDAR")
+    return '\n'.join(parts) + '\n'
 
@@ -33,104 +33,281 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import pandas as pd
+import numpy as np
 import re
+import json
+import os
+import sys
+import atexit
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# lxml's C parser is several times faster than the stdlib html.parser;
+# fall back gracefully if it is not installed
+try:
+    import lxml  # noqa: F401
+    SOUP_PARSER = 'lxml'
+except ImportError:
+    SOUP_PARSER = 'html.parser'
+
+# Patterns compiled once at import so the parse helpers skip the per-call
+# re-cache lookup
+_WS_RE = re.compile(r'\s+')
+_DASH_RE = re.compile(r'[–—~-]')
+_TIME_RANGE_RE = re.compile(r'(\d{1,2}:\d{2}\s*[ap]m)\s*-\s*(\d{1,2}:\d{2}\s*[ap]m)')
+_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+_LEFT_RE = re.compile(r'left:\s*(\d+(?:\.\d+)?)%')
+
+# Weekly-view day columns are evenly spaced at 100/7 percent steps
+_DAYS = ('Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat')
+_DAY_STEP = 100 / 7
+
+def _batch_day_indices(styles):
+    """Nearest-day-column lookup for a whole batch of style strings.
+
+    Extracts the left offsets once and resolves all day indices with a
+    single clip/round over a NumPy array instead of per-event arithmetic.
+    """
+    left_pct = np.array(
+        [float(m.group(1)) if (m := _LEFT_RE.search(s or '')) else 0.0 for s in styles],
+        dtype=np.float32
+    )
+    return np.clip(np.round(left_pct / _DAY_STEP), 0, 6).astype(np.int8)
+
+# Compiled once so every scraper construction reuses the same pattern
+_DESC_RE = re.compile(
+    r'^([A-Z0-9&\s]+)\n([^A-Z0-9].+?)(?=\n[A-Z0-9&\s]+\n|\nView a video|\n\[|\Z)',
+    re.MULTILINE | re.DOTALL
+)
+
+# Local cache for scraped class descriptions so repeated runs skip the HTTP fetch
+DESCRIPTIONS_CACHE_FILE = "descriptions.json"
+DESCRIPTIONS_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Background worker that fetches descriptions while Chrome starts up
+_DESCRIPTIONS_POOL = ThreadPoolExecutor(max_workers=1)
+
+# Collects every class event (plus any tooltip text triggered by a synthetic
+# hover) in a single WebDriver round-trip instead of one hover per element
+_EXTRACT_EVENTS_JS = """
+return Array.from(document.querySelectorAll('.dse-event')).map(function (el) {
+    el.dispatchEvent(new MouseEvent('mouseover', {bubbles: true}));
+    var tip = document.querySelector('.dse-tooltip');
+    var title = el.querySelector('.dse-event-title');
+    var time = el.querySelector('.dse-event-time');
+    return {
+        aria: el.getAttribute('aria-label'),
+        style: el.getAttribute('style'),
+        title: title ? title.innerText : '',
+        time: time ? time.innerText : '',
+        studio: tip ? tip.innerText : ''
+    };
+});
+"""
 
 class CMUGroupXSeleniumScraper:
-    def __init__(self, headless=False):
-        self.setup_driver(headless)
+    # Shared Chrome instance reused across scraper constructions — spawning a
+    # fresh browser (plus a ChromeDriver probe) costs several seconds per run
+    _driver = None
+    _driver_path = None
+    _driver_lock = threading.Lock()
+
+    def __init__(self, headless=False, interactive=None):
+        # Non-interactive runs (CI, headless automation) must never block on
+        # input() prompts — fail fast instead
+        self.interactive = sys.stdin.isatty() if interactive is None else interactive
         self.schedule_url = "https://cmu.dserec.com/online/cr/programs/1/program-classes-weekly-view"
         self.descriptions_url = "https://athletics.cmu.edu/recreation/groupxdescriptions"
-        
-        # Load class descriptions
+
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
-        self.class_descriptions = self.load_class_descriptions()
-        
+
+        # Size the connection pool explicitly and retry transient failures so
+        # parallel description lookups reuse keep-alive connections instead of
+        # queueing on the default 10-slot pool
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.2,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Kick off the descriptions fetch in the background so the HTTP GET +
+        # parse overlaps Chrome startup — both are I/O-bound
+        self._descriptions_future = _DESCRIPTIONS_POOL.submit(self.load_class_descriptions)
+        self._class_descriptions = None
+        self._word_index = None
+
+        self.setup_driver(headless)
+
+    @property
+    def class_descriptions(self):
+        """Class descriptions dict; blocks on the background fetch on first access"""
+        if self._class_descriptions is None:
+            self._class_descriptions = self._descriptions_future.result()
+        return self._class_descriptions
+
     def setup_driver(self, headless):
-        """Setup Chrome WebDriver with automatic driver management"""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
+        """Setup Chrome WebDriver, reusing the shared instance when possible"""
         try:
-            # Automatically download and setup ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.driver = self._get_driver(headless)
             print("Chrome WebDriver setup successful!")
         except Exception as e:
             print(f"Error setting up Chrome driver: {e}")
             raise
+
+    @classmethod
+    def _get_driver(cls, headless):
+        """Return the shared Chrome WebDriver, creating it on first use"""
+        with cls._driver_lock:
+            if cls._driver is not None:
+                return cls._driver
+
+            chrome_options = Options()
+            if headless:
+                chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--window-size=1920,1080")
+
+            # Cache the ChromeDriver path so repeated constructions skip the
+            # webdriver_manager probe
+            if cls._driver_path is None:
+                cls._driver_path = ChromeDriverManager().install()
+
+            cls._driver = webdriver.Chrome(service=Service(cls._driver_path), options=chrome_options)
+            atexit.register(cls._shutdown)
+            return cls._driver
+
+    @classmethod
+    def _shutdown(cls):
+        """Quit the shared browser (registered via atexit)"""
+        with cls._driver_lock:
+            if cls._driver is not None:
+                try:
+                    cls._driver.quit()
+                except Exception:
+                    pass
+                cls._driver = None
             
     def load_class_descriptions(self):
-        """Load class descriptions from the CMU athletics website"""
+        """Load class descriptions from the CMU athletics website (cached locally)"""
+        # Reuse the local JSON cache if it is fresh enough to skip the HTTP fetch
+        cached = self._load_cached_descriptions()
+        if cached is not None:
+            return cached
+
         descriptions = {}
         try:
             print("Loading class descriptions...")
             response = self.session.get(self.descriptions_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
+            soup = BeautifulSoup(response.content, SOUP_PARSER)
+
             content = soup.get_text()
-            
-            # Parse the descriptions using regex patterns
-            pattern = r'^([A-Z0-9&\s]+)\n([^A-Z0-9].+?)(?=\n[A-Z0-9&\s]+\n|\nView a video|\n\[|\Z)'
-            matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
-            
+
+            # Parse the descriptions using the precompiled regex pattern
+            matches = _DESC_RE.findall(content)
+
             for match in matches:
                 class_name = match[0].strip()
                 description = match[1].strip()
                 clean_name = self.normalize_class_name(class_name)
                 descriptions[clean_name] = description
-                
+
             print(f"Loaded {len(descriptions)} class descriptions")
-                
+            self._save_cached_descriptions(descriptions)
+
         except Exception as e:
             print(f"Warning: Could not load class descriptions: {e}")
-            
+
         return descriptions
-    
-    def normalize_class_name(self, name):
-        """Normalize class names for matching"""
-        normalized = re.sub(r'\s+', ' ', name.lower().strip())
+
+    def _load_cached_descriptions(self):
+        """Return descriptions from the local cache file if fresh, else None"""
+        try:
+            if os.path.exists(DESCRIPTIONS_CACHE_FILE):
+                age = time.time() - os.path.getmtime(DESCRIPTIONS_CACHE_FILE)
+                if age < DESCRIPTIONS_CACHE_TTL_SECONDS:
+                    with open(DESCRIPTIONS_CACHE_FILE) as f:
+                        descriptions = json.load(f)
+                    print(f"Loaded {len(descriptions)} class descriptions from cache")
+                    return descriptions
+        except Exception as e:
+            print(f"Warning: Could not read descriptions cache: {e}")
+        return None
+
+    def _save_cached_descriptions(self, descriptions):
+        """Persist descriptions to the local cache file"""
+        try:
+            with open(DESCRIPTIONS_CACHE_FILE, "w") as f:
+                json.dump(descriptions, f)
+        except Exception as e:
+            print(f"Warning: Could not write descriptions cache: {e}")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def normalize_class_name(name):
+        """Normalize class names for matching (memoized)"""
+        normalized = _WS_RE.sub(' ', name.lower().strip())
         variations = {
             'indoor cycling': 'cycling',
             'hiit': 'high intensity interval training',
             'kettlebell cardio hiit': 'kettlebells',
         }
-        
+
         for variation, standard in variations.items():
             if variation in normalized:
                 normalized = standard
                 break
-                
+
         return normalized
     
+    def _get_word_index(self):
+        """Word -> description-name inverted index, built once per load"""
+        if self._word_index is None:
+            index = defaultdict(list)
+            for desc_name in self.class_descriptions:
+                for word in desc_name.split():
+                    index[word].append(desc_name)
+            self._word_index = index
+        return self._word_index
+
     def get_class_description(self, class_name):
         """Get description for a class name"""
         normalized = self.normalize_class_name(class_name)
-        
-        if normalized in self.class_descriptions:
-            return self.class_descriptions[normalized]
-        
-        for desc_name, description in self.class_descriptions.items():
+        descriptions = self.class_descriptions
+
+        if normalized in descriptions:
+            return descriptions[normalized]
+
+        # Only run the substring test against names that share a word with
+        # the query instead of scanning every description
+        word_index = self._get_word_index()
+        candidates = {name for word in normalized.split() for name in word_index.get(word, ())}
+        for desc_name in candidates:
             if normalized in desc_name or desc_name in normalized:
-                return description
-                
+                return descriptions[desc_name]
+
         return "Description not available"
     
     def wait_for_schedule_to_load(self, timeout=30):
@@ -151,9 +328,8 @@ class CMUGroupXSeleniumScraper:
     def parse_time_range(self, time_text):
         """Parse time range text into start and end times"""
         try:
-            time_text = re.sub(r'[–—~-]', '-', time_text)
-            time_pattern = r'(\d{1,2}:\d{2}\s*[ap]m)\s*-\s*(\d{1,2}:\d{2}\s*[ap]m)'
-            match = re.search(time_pattern, time_text.lower())
+            time_text = _DASH_RE.sub('-', time_text)
+            match = _TIME_RANGE_RE.search(time_text.lower())
             
             if match:
                 return match.group(1).strip(), match.group(2).strip()
@@ -186,19 +362,43 @@ class CMUGroupXSeleniumScraper:
             # Check if login is required
             current_url = self.driver.current_url
             if 'login' in current_url.lower() or 'auth' in current_url.lower():
-                print("Login required! Please log in manually in the browser window.")
-                print("After logging in, navigate back to the schedule page.")
-                input("Press Enter after you've logged in and can see the schedule...")
-            
-            # Wait for page to load
-            time.sleep(5)
-            
+                if self.interactive:
+                    print("Login required! Please log in manually in the browser window.")
+                    print("After logging in, navigate back to the schedule page.")
+                    input("Press Enter after you've logged in and can see the schedule...")
+                else:
+                    raise RuntimeError("Login required but running non-interactively")
+
+            # Interactive runs give the page a moment to settle; automation
+            # relies solely on wait_for_schedule_to_load
+            if self.interactive:
+                time.sleep(5)
+
             # Try to wait for schedule to load automatically
             if not self.wait_for_schedule_to_load(timeout=15):
-                print("Schedule didn't load automatically. Please ensure you're on the schedule page.")
-                input("Press Enter when you can see the schedule grid...")
-            
-            # Find class elements using Selenium
+                if self.interactive:
+                    print("Schedule didn't load automatically. Please ensure you're on the schedule page.")
+                    input("Press Enter when you can see the schedule grid...")
+                else:
+                    raise RuntimeError("Schedule did not load while running non-interactively")
+            
+            # Fast path: one JavaScript round-trip grabs every event and its
+            # tooltip text at once — no per-element hovers, sleeps, or re-parses
+            try:
+                js_events = self.driver.execute_script(_EXTRACT_EVENTS_JS)
+                if js_events:
+                    print(f"Extracted {len(js_events)} class events in a single DOM pass")
+                    # Resolve every event's day column in one NumPy pass
+                    day_indices = _batch_day_indices([e.get('style') for e in js_events])
+                    for js_event, day_idx in zip(js_events, day_indices):
+                        class_info = self.parse_js_event(js_event, fallback_weekday=_DAYS[day_idx])
+                        if class_info:
+                            classes_data.append(class_info)
+                    return classes_data
+            except Exception as e:
+                print(f"Error with JavaScript extraction: {e}")
+
+            # Fallback: per-element hover loop using Selenium
             try:
                 # Get all class event elements using Selenium
                 event_elements = self.driver.find_elements(By.CLASS_NAME, "dse-event")
@@ -218,29 +418,36 @@ class CMUGroupXSeleniumScraper:
                         
                         # Scroll element into view first
                         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                        time.sleep(0.5)
-                        
-                        # Simulate hover to trigger any tooltips/popups
+                        try:
+                            WebDriverWait(self.driver, 0.5).until(EC.visibility_of(element))
+                        except TimeoutException:
+                            pass
+
+                        # Simulate hover to trigger any tooltips/popups, then
+                        # wait only as long as the tooltip takes to appear
                         actions = ActionChains(self.driver)
                         actions.move_to_element(element).perform()
-                        time.sleep(2)  # Wait for hover effects
-                        
-                        # Now get the updated page source
-                        page_source = self.driver.page_source
-                        soup = BeautifulSoup(page_source, 'html.parser')
+                        try:
+                            WebDriverWait(self.driver, 2).until(
+                                EC.visibility_of_element_located((By.CSS_SELECTOR, ".dse-tooltip"))
+                            )
+                        except TimeoutException:
+                            pass
                         
-                        # Find this specific element in the soup
-                        aria_label = element.get_attribute('aria-label')
-                        matching_elements = soup.find_all('div', {'aria-label': aria_label})
-                        
-                        if matching_elements:
-                            class_info = self.parse_dse_event_with_hover(matching_elements[0], element)
-                            if class_info:
-                                classes_data.append(class_info)
+                        # Parse only this element's fragment — serializing and
+                        # re-parsing the entire page per iteration is O(DOM)
+                        # work for a single event's worth of markup
+                        fragment = BeautifulSoup(element.get_attribute('outerHTML'), SOUP_PARSER)
+                        soup_element = fragment.find('div', class_='dse-event') or fragment
+
+                        class_info = self.parse_dse_event_with_hover(soup_element, element)
+                        if class_info:
+                            classes_data.append(class_info)
                         
-                        # Move mouse away to clear hover state
-                        actions.move_by_offset(100, 100).perform()
-                        time.sleep(0.5)
+                        # Clear hover state without moving the mouse and sleeping
+                        self.driver.execute_script(
+                            "document.body.dispatchEvent(new MouseEvent('mouseout', {bubbles: true}));"
+                        )
                         
                     except Exception as e:
                         print(f"Error processing element {i}: {e}")
@@ -250,7 +457,7 @@ class CMUGroupXSeleniumScraper:
                 print(f"Error with Selenium approach: {e}")
                 # Fallback to original method
                 page_source = self.driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
+                soup = BeautifulSoup(page_source, SOUP_PARSER)
                 dse_events = soup.find_all('div', class_='dse-event')
                 print(f"Fallback: Found {len(dse_events)} class events with BeautifulSoup")
                 
@@ -264,6 +471,64 @@ class CMUGroupXSeleniumScraper:
         
         return classes_data
 
+    def parse_js_event(self, js_event, fallback_weekday=None):
+        """Parse one event dict returned by the single-pass JavaScript extraction.
+
+        fallback_weekday carries the batch-computed day column used when the
+        aria-label has no date.
+        """
+        try:
+            class_name = (js_event.get('title') or '').strip()
+            time_range_text = (js_event.get('time') or '').strip()
+            aria_label = js_event.get('aria') or ''
+            studio = (js_event.get('studio') or '').strip()
+
+            weekday = ""
+            if aria_label:
+                date_matches = _DATE_RE.findall(aria_label)
+                if date_matches:
+                    try:
+                        date_obj = datetime.strptime(date_matches[0], '%m/%d/%Y')
+                        weekday = date_obj.strftime('%a')
+                    except:
+                        pass
+
+            if not weekday:
+                if fallback_weekday is not None:
+                    weekday = fallback_weekday
+                else:
+                    style = js_event.get('style') or ""
+                    left_percentage = 0
+                    left_match = _LEFT_RE.search(style)
+                    if left_match:
+                        left_percentage = float(left_match.group(1))
+
+                    # Day columns sit at multiples of 100/7 percent, so the
+                    # nearest column is a single rounded division
+                    day_idx = max(0, min(6, int(round(left_percentage / _DAY_STEP))))
+                    weekday = _DAYS[day_idx]
+
+            start_time, end_time = self.parse_time_range(time_range_text)
+
+            return {
+                'term_name': 'Fall Mini 1 2025',
+                'term_start_date': '2025-08-25',
+                'term_end_date': '2025-10-11',
+                'registration_url': self.schedule_url,
+                'campus_area': self.determine_campus_area(studio),
+                'weekday': weekday,
+                'class_name': class_name,
+                'time_range_text': time_range_text,
+                'start_time_local': start_time,
+                'end_time_local': end_time,
+                'studio': studio,
+                'class_description': self.get_class_description(class_name)
+            }
+
+        except Exception as e:
+            print(f"Error parsing JS-extracted event: {e}")
+            return None
+
     def parse_dse_event_with_hover(self, soup_element, selenium_element):
         """Parse DSE event with hover data from Selenium element"""
         try:
@@ -281,9 +546,14 @@ class CMUGroupXSeleniumScraper:
             studio = ""
             
             try:
-                # Wait a bit for popup to appear
-                time.sleep(1)
-                
+                # Wait only until the popup appears instead of a fixed pause
+                try:
+                    WebDriverWait(self.driver, 1).until(
+                        EC.visibility_of_element_located((By.CSS_SELECTOR, ".dse-tooltip"))
+                    )
+                except TimeoutException:
+                    pass
+
                 # Look for elements with specific text content
                 studio_elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'Keeler') or contains(text(), 'Kenner') or contains(text(), 'Noll') or contains(text(), 'Studio')]")
                 
@@ -301,8 +571,7 @@ class CMUGroupXSeleniumScraper:
             # Parse other data same as before
             weekday = ""
             if aria_label:
-                date_pattern = r'(\d{1,2}/\d{1,2}/\d{4})'
-                date_matches = re.findall(date_pattern, aria_label)
+                date_matches = _DATE_RE.findall(aria_label)
                 if date_matches:
                     try:
                         date_obj = datetime.strptime(date_matches[0], '%m/%d/%Y')
@@ -312,18 +581,15 @@ class CMUGroupXSeleniumScraper:
             
             style = selenium_element.get_attribute('style') or ""
             left_percentage = 0
-            left_match = re.search(r'left:\s*(\d+(?:\.\d+)?)%', style)
+            left_match = _LEFT_RE.search(style)
             if left_match:
                 left_percentage = float(left_match.group(1))
             
-            day_mapping = {
-                0: 'Sun', 14.3: 'Mon', 28.6: 'Tue', 42.9: 'Wed',
-                57.1: 'Thu', 71.4: 'Fri', 85.7: 'Sat'
-            }
-            
             if not weekday and left_percentage is not None:
-                closest_percentage = min(day_mapping.keys(), key=lambda x: abs(x - left_percentage))
-                weekday = day_mapping[closest_percentage]
+                # Day columns sit at multiples of 100/7 percent, so the
+                # nearest column is a single rounded division
+                day_idx = max(0, min(6, int(round(left_percentage / _DAY_STEP))))
+                weekday = _DAYS[day_idx]
             
             start_time, end_time = self.parse_time_range(time_range_text)
             
@@ -364,8 +630,7 @@ class CMUGroupXSeleniumScraper:
             weekday = ""
             
             if aria_label:
-                date_pattern = r'(\d{1,2}/\d{1,2}/\d{4})'
-                date_matches = re.findall(date_pattern, aria_label)
+                date_matches = _DATE_RE.findall(aria_label)
                 if date_matches:
                     try:
                         date_obj = datetime.strptime(date_matches[0], '%m/%d/%Y')
@@ -376,18 +641,15 @@ class CMUGroupXSeleniumScraper:
             # Extract positioning to determine day column
             style = event_element.get('style', '')
             left_percentage = 0
-            left_match = re.search(r'left:\s*(\d+(?:\.\d+)?)%', style)
+            left_match = _LEFT_RE.search(style)
             if left_match:
                 left_percentage = float(left_match.group(1))
             
-            day_mapping = {
-                0: 'Sun', 14.3: 'Mon', 28.6: 'Tue', 42.9: 'Wed',
-                57.1: 'Thu', 71.4: 'Fri', 85.7: 'Sat'
-            }
-            
             if not weekday and left_percentage is not None:
-                closest_percentage = min(day_mapping.keys(), key=lambda x: abs(x - left_percentage))
-                weekday = day_mapping[closest_percentage]
+                # Day columns sit at multiples of 100/7 percent, so the
+                # nearest column is a single rounded division
+                day_idx = max(0, min(6, int(round(left_percentage / _DAY_STEP))))
+                weekday = _DAYS[day_idx]
             
             start_time, end_time = self.parse_time_range(time_range_text)
             
@@ -410,10 +672,20 @@ class CMUGroupXSeleniumScraper:
             print(f"Error parsing event: {e}")
             return None
     
-    def close_driver(self):
-        """Close the browser driver"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
+    def close_driver(self, shutdown=False):
+        """Reset the shared browser for the next run, or quit it if shutdown=True"""
+        if not hasattr(self, 'driver'):
+            return
+        if shutdown:
+            self._shutdown()
+        else:
+            # Cheap reset keeps the browser warm for the next scrape; atexit
+            # handles the real quit
+            try:
+                self.driver.delete_all_cookies()
+                self.driver.get("about:blank")
+            except Exception as e:
+                print(f"Error resetting browser: {e}")
     
     def save_to_csv(self, df, filename="cmu_groupx_classes.csv"):
         """Save DataFrame to CSV"""
@@ -5,19 +5,44 @@
 import pandas as pd
 import numpy as np
 import re
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, time as datetime_time
 from typing import Optional, Tuple, List, Dict, Any
 
+# Compiled once so scalar and column-level calls reuse the same patterns
+_TZ_SUFFIX_RE = re.compile(r'\s*\b(?:EDT|EST|CDT|CST|MDT|MST|PDT|PST|UTC)\b\s*')
+_WEEKDAY_PREFIX_RE = re.compile(r'^[A-Za-z]+,\s*')
+# Timed Google events carry a time component plus an offset/Z suffix;
+# fused into one pattern so the filter is a single column scan
+_HAS_TIME_RE = re.compile(r'T.*:.*(?:[-+]\d{2}:\d{2}|Z)')
+
+# Cached at import so per-row parsing skips datetime.now() + str()
+_CURRENT_YEAR_STR = str(datetime.now().year)
+
 # ===========================
 # HELPER FUNCTIONS
 # ===========================
 
 def safe_timezone_convert(dt_series: pd.Series, target_tz: str = 'UTC') -> pd.Series:
     """Safely convert datetime series to target timezone"""
-    return dt_series.apply(
-        lambda x: x.tz_convert(target_tz) if x is not pd.NaT and x.tz is not None 
-        else (x.tz_localize(target_tz) if x is not pd.NaT and x.tz is None else x)
-    )
+    # Datetime dtype: the whole column is either naive or aware, so a single
+    # vectorized localize/convert covers it without a per-element apply
+    if pd.api.types.is_datetime64_any_dtype(dt_series):
+        if dt_series.dt.tz is None:
+            return dt_series.dt.tz_localize(target_tz, nonexistent='shift_forward', ambiguous='NaT')
+        return dt_series.dt.tz_convert(target_tz)
+
+    # Object dtype mixing naive and aware timestamps: split once on a mask
+    # and handle each side vectorized
+    out = dt_series.copy()
+    valid = out.notna()
+    naive = valid & out.map(lambda x: getattr(x, 'tz', None) is None)
+    aware = valid & ~naive
+    if naive.any():
+        out.loc[naive] = pd.to_datetime(out.loc[naive]).dt.tz_localize(target_tz)
+    if aware.any():
+        out.loc[aware] = pd.to_datetime(out.loc[aware], utc=True).dt.tz_convert(target_tz)
+    return out
 
 def standardize_columns(df: pd.DataFrame, column_mapping: Dict[str, str]) -> pd.DataFrame:
     """Standardize column names and clean basic fields"""
@@ -31,34 +56,90 @@ def standardize_columns(df: pd.DataFrame, column_mapping: Dict[str, str]) -> pd.
     return df
 
 def parse_datetime_efficiently(date_str: str) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
-    """Optimized datetime parsing with fewer try/except blocks"""
+    """Optimized datetime parsing without redundant try/except blocks"""
     if pd.isna(date_str) or not date_str:
         return None, None
-    
+
     date_str = str(date_str).strip()
-    
-    # Try direct pandas parsing first (fastest)
-    try:
-        single_dt = pd.to_datetime(date_str, errors='coerce', utc=True)
-        if pd.notna(single_dt):
-            return single_dt, None
-    except:
-        pass
-    
-    # Handle specific formats
+
+    # Route known multi-part formats straight to their handlers so they skip
+    # a doomed direct-parse attempt
     if '→' in date_str:
         # ISO format: "2024-01-15T18:00:00Z → 2024-01-15T20:00:00Z"
         parts = date_str.split('→', 1)
         start_dt = pd.to_datetime(parts[0].strip(), errors='coerce', utc=True)
         end_dt = pd.to_datetime(parts[1].strip(), errors='coerce', utc=True)
         return start_dt, end_dt
-    
-    elif '·' in date_str and '-' in date_str:
+
+    if '·' in date_str and '-' in date_str:
         # Natural language: "Saturday, October 4 · 10:15 - 11:15am EDT"
         return parse_natural_language_datetime(date_str)
-    
+
+    # Direct parse; errors='coerce' already suppresses bad input, so no
+    # enclosing try/except is needed
+    single_dt = pd.to_datetime(date_str, errors='coerce', utc=True)
+    if pd.notna(single_dt):
+        return single_dt, None
+
     return None, None
 
+def parse_datetime_column(series: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Parse a whole column of mixed-format date strings into (start, end) Series.
+
+    Batched version of parse_datetime_efficiently: one C-level pd.to_datetime
+    pass over the column plus mask-based handling of the arrow and
+    natural-language formats, instead of a scalar parse per row.
+    """
+    s = series.fillna('').astype(str).str.strip()
+
+    # Direct parse for the whole column at once; format='mixed' parses
+    # each element on its own, so a column mixing time styles doesn't
+    # get one inferred format forced onto every row (which would coerce
+    # the non-matching rows to NaT)
+    start = pd.to_datetime(s, errors='coerce', utc=True, format='mixed')
+    end = pd.Series(pd.NaT, index=s.index, dtype='datetime64[ns, UTC]')
+
+    # ISO range format: "2024-01-15T18:00:00Z → 2024-01-15T20:00:00Z"
+    arrow_mask = start.isna() & s.str.contains('→', na=False)
+    if arrow_mask.any():
+        parts = s[arrow_mask].str.split('→', n=1, expand=True)
+        start.loc[arrow_mask] = pd.to_datetime(parts[0].str.strip(), errors='coerce',
+                                               utc=True, format='mixed')
+        end.loc[arrow_mask] = pd.to_datetime(parts[1].str.strip(), errors='coerce',
+                                             utc=True, format='mixed')
+
+    # Natural language: "Saturday, October 4 · 10:15 - 11:15am EDT"
+    natural_mask = start.isna() & s.str.contains('·', na=False) & s.str.contains('-', na=False)
+    if natural_mask.any():
+        nat = s[natural_mask].str.replace(_TZ_SUFFIX_RE, '', regex=True)
+        parts = nat.str.split('·', n=1, expand=True)
+
+        # Drop the weekday prefix and append the year when missing
+        date_part = parts[0].str.strip().str.replace(_WEEKDAY_PREFIX_RE, '', regex=True)
+        date_part = date_part.where(date_part.str.contains(_CURRENT_YEAR_STR),
+                                    date_part + f', {_CURRENT_YEAR_STR}')
+
+        times = parts[1].str.strip().str.split('-', n=1, expand=True)
+        start_times = times[0].str.strip()
+        end_times = times[1].str.strip() if times.shape[1] > 1 else pd.Series('', index=times.index)
+        end_times = end_times.fillna('')
+
+        # AM/PM inheritance: "10:15 - 11:15am" means 10:15am
+        end_suffix = end_times.str[-2:].str.lower()
+        inherit_mask = end_suffix.isin(['am', 'pm']) & ~start_times.str[-2:].str.lower().isin(['am', 'pm'])
+        start_times = start_times.where(~inherit_mask, start_times + end_suffix)
+
+        # Rows whose time part has no range dash get no timestamps at
+        # all, like the scalar parser — otherwise the bare date would
+        # parse to a spurious midnight
+        has_range = end_times.ne('')
+        start.loc[natural_mask] = pd.to_datetime((date_part + ' ' + start_times).where(has_range),
+                                                 errors='coerce', utc=True, format='mixed')
+        end.loc[natural_mask] = pd.to_datetime((date_part + ' ' + end_times).where(has_range),
+                                               errors='coerce', utc=True, format='mixed')
+
+    return start, end
+
 def parse_natural_language_datetime(date_str: str) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
     """Parse natural language datetime format"""
     try:
@@ -66,10 +147,8 @@ def parse_natural_language_datetime(date_str: str) -> Tuple[Optional[pd.Timestam
         date_part = date_part.strip()
         time_part = time_part.strip()
         
-        # Remove timezone suffixes
-        timezone_suffixes = ['EDT', 'EST', 'CDT', 'CST', 'MDT', 'MST', 'PDT', 'PST', 'UTC']
-        for tz in timezone_suffixes:
-            time_part = time_part.replace(tz, '').strip()
+        # Remove timezone suffixes in one compiled-regex pass
+        time_part = _TZ_SUFFIX_RE.sub(' ', time_part).strip()
         
         if '-' not in time_part:
             return None, None
@@ -78,15 +157,16 @@ def parse_natural_language_datetime(date_str: str) -> Tuple[Optional[pd.Timestam
         start_time_str = start_time_str.strip()
         end_time_str = end_time_str.strip()
         
-        # Handle AM/PM inheritance
-        if ('am' in end_time_str or 'pm' in end_time_str) and not ('am' in start_time_str or 'pm' in start_time_str):
-            am_pm = 'am' if 'am' in end_time_str else 'pm'
-            start_time_str += am_pm
-        
+        # Handle AM/PM inheritance — the meridiem only ever appears as a
+        # suffix, so O(1) suffix checks beat four full substring scans
+        end_suffix = end_time_str[-2:].lower()
+        if end_suffix in ('am', 'pm') and start_time_str[-2:].lower() not in ('am', 'pm'):
+            start_time_str += end_suffix
+
         # Clean up date part
-        date_clean = re.sub(r'^[A-Za-z]+,\s*', '', date_part)
-        if str(datetime.now().year) not in date_clean:
-            date_clean += f', {datetime.now().year}'
+        date_clean = _WEEKDAY_PREFIX_RE.sub('', date_part)
+        if _CURRENT_YEAR_STR not in date_clean:
+            date_clean += f', {_CURRENT_YEAR_STR}'
         
         # Parse both datetimes
         start_datetime_str = f"{date_clean} {start_time_str}"
@@ -106,24 +186,32 @@ def parse_natural_language_datetime(date_str: str) -> Tuple[Optional[pd.Timestam
     except:
         return None, None
 
-def create_time_range_display(start: pd.Timestamp, end: Optional[pd.Timestamp]) -> str:
-    """Create user-friendly time range string in Eastern Time"""
-    if pd.isna(start):
-        return None
-    
-    # Convert to Eastern Time for display
-    start_et = start.tz_convert('US/Eastern')
-    
-    if pd.isna(end):
-        return f"{start_et.strftime('%Y-%m-%d %H:%M')} ET"
-    
-    end_et = end.tz_convert('US/Eastern')
-    
-    # Optimized format based on date equality
-    if start_et.date() == end_et.date():
-        return f"{start_et.strftime('%Y-%m-%d %H:%M')} - {end_et.strftime('%H:%M')} ET"
-    else:
-        return f"{start_et.strftime('%Y-%m-%d %H:%M')} - {end_et.strftime('%Y-%m-%d %H:%M')} ET"
+def create_time_range_displays(start: pd.Series, end: pd.Series) -> pd.Series:
+    """Create user-friendly time range strings (Eastern Time) for whole
+    start/end columns.
+
+    One tz_convert and one strftime per column instead of a Python call
+    per row.
+    """
+    start = pd.to_datetime(start, errors='coerce', utc=True)
+    end = pd.to_datetime(end, errors='coerce', utc=True)
+
+    s = start.dt.tz_convert('US/Eastern')
+    e = end.dt.tz_convert('US/Eastern')
+
+    s_fmt = s.dt.strftime('%Y-%m-%d %H:%M')
+    e_same_day = e.dt.strftime('%H:%M')
+    e_other_day = e.dt.strftime('%Y-%m-%d %H:%M')
+    same_day = s.dt.normalize() == e.dt.normalize()
+
+    formatted = np.select(
+        [end.isna(), same_day],
+        [s_fmt + ' ET', s_fmt + ' - ' + e_same_day + ' ET'],
+        default=s_fmt + ' - ' + e_other_day + ' ET'
+    )
+
+    # Rows without a start keep None, matching the scalar helper
+    return pd.Series(np.where(start.isna(), None, formatted), index=start.index)
 
 # ===========================
 # OPTIMIZED CLEANING FUNCTIONS
@@ -143,11 +231,11 @@ def clean_google_calendar_df(df: pd.DataFrame) -> pd.DataFrame:
         'Description': 'description'
     }
     
-    cleaned_df = standardize_columns(df.copy(), column_mapping)
+    # standardize_columns renames into a new frame, so no defensive copy
+    cleaned_df = standardize_columns(df, column_mapping)
     
-    # Filter out date-only events using vectorized operations
-    has_time = cleaned_df['start'].str.contains(r'T.*:', na=False) & \
-               cleaned_df['start'].str.contains(r'[-+]\d{2}:\d{2}|Z', na=False)
+    # Filter out date-only events with one pass of the precompiled pattern
+    has_time = cleaned_df['start'].str.contains(_HAS_TIME_RE, na=False)
     cleaned_df = cleaned_df[has_time]
     
     # Parse datetime columns
@@ -160,161 +248,254 @@ def clean_google_calendar_df(df: pd.DataFrame) -> pd.DataFrame:
     cleaned_df['calendar_event'] = cleaned_df['calendar_event'].replace('', 'Untitled Event')
     cleaned_df['url'] = ''
     
-    # Remove invalid rows
-    cleaned_df = cleaned_df.dropna(subset=['start'])
-    
-    return cleaned_df[['start', 'end', 'calendar_event', 'description', 'location', 'url']]
+    # Keep valid rows and project the output columns in one step
+    return cleaned_df.loc[
+        cleaned_df['start'].notna(),
+        ['start', 'end', 'calendar_event', 'description', 'location', 'url']
+    ].reset_index(drop=True)
 
 def clean_webscraping_df(df: pd.DataFrame) -> pd.DataFrame:
     """Optimized web scraping cleaning"""
     if df.empty:
         return pd.DataFrame(columns=['start', 'end', 'scraped_event', 'description', 'location', 'url'])
     
-    cleaned_df = df.copy()
-    
-    # Vectorized datetime parsing
-    datetime_results = cleaned_df['date_time'].apply(parse_datetime_efficiently)
-    cleaned_df['start'] = [x[0] for x in datetime_results]
-    cleaned_df['end'] = [x[1] for x in datetime_results]
-    
-    # Vectorized location formatting
-    def format_location_vectorized(row):
-        venue = str(row.get('venue', '')) if pd.notna(row.get('venue')) else ''
-        address = str(row.get('address', '')) if pd.notna(row.get('address')) else ''
-        parts = [part for part in [venue, address] if part.strip()]
-        return '- '.join(parts) if parts else ''
-    
-    cleaned_df['location'] = cleaned_df.apply(format_location_vectorized, axis=1)
-    
-    # Standardize remaining columns
-    cleaned_df['scraped_event'] = cleaned_df['title'].fillna('Untitled Event')
-    cleaned_df['description'] = cleaned_df['link'].fillna('')
-    cleaned_df['url'] = cleaned_df['link'].fillna('')
-    
-    # Remove invalid rows
-    cleaned_df = cleaned_df.dropna(subset=['start'])
-    
-    return cleaned_df[['start', 'end', 'scraped_event', 'description', 'location', 'url']]
+    # Vectorized datetime parsing over the whole column
+    start, end = parse_datetime_column(df['date_time'])
+
+    # Column-wise location formatting — no per-row Python calls
+    def stripped_column(col):
+        if col in df.columns:
+            return df[col].fillna('').astype(str).str.strip()
+        return pd.Series('', index=df.index)
+
+    venue = stripped_column('venue')
+    address = stripped_column('address')
+    location = np.where(
+        venue.ne('') & address.ne(''),
+        venue + '- ' + address,
+        venue.where(venue.ne(''), address)
+    )
+
+    # Build the output frame from scratch instead of copying the caller's
+    # frame and mutating columns — one materialization, caller untouched
+    link = df['link'].fillna('')
+    cleaned_df = pd.DataFrame({
+        'start': start,
+        'end': end,
+        'scraped_event': df['title'].fillna('Untitled Event'),
+        'description': link,
+        'location': location,
+        'url': link
+    })
+
+    # Keep valid rows in one masked selection
+    return cleaned_df.loc[cleaned_df['start'].notna()].reset_index(drop=True)
 
 def clean_cmu_scraper_df(df: pd.DataFrame) -> pd.DataFrame:
     """Optimized CMU scraper cleaning with efficient occurrence generation"""
     if df.empty:
         return pd.DataFrame(columns=['start', 'end', 'scraped_event', 'description', 'location', 'url'])
     
-    cleaned_df = df.copy()
-    
     # Pre-compute constants
     weekday_map = {'Mon': 0, 'Tue': 1, 'Wed': 2, 'Thu': 3, 'Fri': 4, 'Sat': 5, 'Sun': 6}
     current_time = pd.Timestamp.now(tz='UTC')
-    
-    all_occurrences = []
-    
-    # Vectorized approach where possible
-    for _, row in cleaned_df.iterrows():
-        occurrences = generate_class_occurrences_optimized(row, weekday_map, current_time)
-        all_occurrences.extend(occurrences)
-    
-    if not all_occurrences:
-        return pd.DataFrame(columns=['start', 'end', 'scraped_event', 'description', 'location', 'url'])
-    
-    result_df = pd.DataFrame(all_occurrences)
+
+    # Expand weekly classes into occurrences with column operations; fall
+    # back to the per-row path if the vectorized expansion hits bad data.
+    # Neither path mutates the caller's frame, so no defensive copy.
+    try:
+        result_df = _generate_occurrences_vectorized(df, weekday_map)
+    except Exception:
+        result_df = pd.DataFrame()
+
+    if result_df.empty:
+        # Even on the fallback path, parse the shared term/weekday columns
+        # once for the whole frame instead of per row, and drop rows that
+        # could never produce occurrences
+        fallback_df = df.assign(
+            term_start_ts=pd.to_datetime(df['term_start_date'], errors='coerce'),
+            term_end_ts=pd.to_datetime(df['term_end_date'], errors='coerce'),
+            weekday_int=df['weekday'].map(weekday_map)
+        ).dropna(subset=['term_start_ts', 'term_end_ts', 'weekday_int'])
+
+        all_occurrences = []
+        # itertuples yields lightweight namedtuples instead of boxing a
+        # Series per row like iterrows
+        for row in fallback_df.itertuples(index=False):
+            all_occurrences.extend(generate_class_occurrences_optimized(row))
+
+        if not all_occurrences:
+            return pd.DataFrame(columns=['start', 'end', 'scraped_event', 'description', 'location', 'url'])
+
+        result_df = pd.DataFrame(all_occurrences)
     
     # Vectorized location formatting
-    result_df['location'] = result_df.apply(
-        lambda row: format_cmu_location_optimized(row.get('studio'), row.get('campus_area')), 
-        axis=1
+    result_df['location'] = format_cmu_location_optimized(
+        result_df.get('studio', pd.Series('', index=result_df.index)),
+        result_df.get('campus_area', pd.Series('', index=result_df.index))
     )
     
-    # Set other required columns
-    result_df['scraped_event'] = result_df['class_name'].fillna('Untitled Class')
-    result_df['description'] = result_df['class_description'].fillna(result_df['registration_url'].fillna(''))
-    result_df['url'] = result_df['registration_url'].fillna('')
-    
-    # Filter future events only
-    result_df = result_df[result_df['start'] >= current_time]
+    # Set other required columns: fill the registration URL once and
+    # assign all three outputs in a single pass
+    registration_url = result_df['registration_url'].fillna('')
+    result_df = result_df.assign(
+        scraped_event=result_df['class_name'].fillna('Untitled Class'),
+        description=result_df['class_description'].fillna(registration_url),
+        url=registration_url
+    )
     
-    return result_df[['start', 'end', 'scraped_event', 'description', 'location', 'url']]
+    # Keep future events and project the output columns in one step
+    return result_df.loc[
+        result_df['start'] >= current_time,
+        ['start', 'end', 'scraped_event', 'description', 'location', 'url']
+    ].reset_index(drop=True)
+
+def _generate_occurrences_vectorized(df: pd.DataFrame, weekday_map: Dict[str, int]) -> pd.DataFrame:
+    """Expand weekly classes into per-occurrence rows using column ops.
+
+    Replaces the iterrows loop: the first class date is computed for the
+    whole frame at once, the weekly dates are exploded, and each datetime
+    column is localized/converted in a single call.
+    """
+    # Derived columns live in local Series so the caller's frame is never
+    # copied or written to
+    term_start = pd.to_datetime(df['term_start_date'], errors='coerce')
+    term_end = pd.to_datetime(df['term_end_date'], errors='coerce')
+    wd_int = df['weekday'].map(weekday_map)
+    start_times = df['start_time_local'].map(_parse_local_time)
+    end_times = df['end_time_local'].map(_parse_local_time)
+
+    valid = (term_start.notna() & term_end.notna() & wd_int.notna()
+             & start_times.notna() & end_times.notna())
+    if not valid.any():
+        return pd.DataFrame()
+
+    # Vectorized "next occurrence of this weekday on/after term start"
+    days_ahead = (wd_int[valid] - term_start[valid].dt.weekday) % 7
+    first_dates = term_start[valid] + pd.to_timedelta(days_ahead, unit='D')
+
+    # One date_range per class, then explode to one row per occurrence
+    work = df.loc[valid].assign(
+        _start_time=start_times[valid],
+        _end_time=end_times[valid],
+        _dates=[
+            pd.date_range(first, last, freq='7D')
+            for first, last in zip(first_dates, term_end[valid])
+        ]
+    )
+    work = work.explode('_dates').dropna(subset=['_dates'])
+
+    if work.empty:
+        return pd.DataFrame()
+
+    # explode leaves an object column of Timestamps; restore datetime dtype
+    work['_dates'] = pd.to_datetime(work['_dates'])
 
-def generate_class_occurrences_optimized(row: pd.Series, weekday_map: Dict[str, int], current_time: pd.Timestamp) -> List[Dict]:
-    """Optimized occurrence generation"""
+    work['start'] = pd.DatetimeIndex(
+        [datetime.combine(d.date(), t) for d, t in zip(work['_dates'], work['_start_time'])]
+    ).tz_localize('US/Eastern', nonexistent='shift_forward', ambiguous='NaT').tz_convert('UTC')
+    work['end'] = pd.DatetimeIndex(
+        [datetime.combine(d.date(), t) for d, t in zip(work['_dates'], work['_end_time'])]
+    ).tz_localize('US/Eastern', nonexistent='shift_forward', ambiguous='NaT').tz_convert('UTC')
+    work['occurrence_date'] = work['_dates'].dt.strftime('%Y-%m-%d')
+
+    work = work.dropna(subset=['start', 'end'])
+    return work.drop(columns=['_start_time', '_end_time', '_dates'])
+
+_LOCAL_TIME_FORMATS = ('%I:%M%p', '%I:%M %p', '%H:%M:%S', '%H:%M')
+
+def _parse_local_time(value: Any) -> Optional[datetime_time]:
+    """Parse a local time string like '8:00am' into a datetime.time"""
+    text = str(value).strip().lower()
+    for fmt in _LOCAL_TIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).time()
+        except ValueError:
+            continue
+    return None
+
+def generate_class_occurrences_optimized(row: Any) -> List[Dict]:
+    """Optimized occurrence generation for one itertuples row"""
     try:
-        # Parse term dates once
-        term_start = pd.to_datetime(row['term_start_date'], errors='coerce')
-        term_end = pd.to_datetime(row['term_end_date'], errors='coerce')
-        
-        if pd.isna(term_start) or pd.isna(term_end):
-            return []
-        
-        weekday = row['weekday']
-        if weekday not in weekday_map:
-            return []
-        
+        # Term dates and weekday are pre-parsed for the whole frame by the
+        # caller; terms are shared across many classes
+        term_start = row.term_start_ts
+        term_end = row.term_end_ts
+
         # Calculate first occurrence
         effective_start = term_start.date()
-        target_weekday = weekday_map[weekday]
+        target_weekday = int(row.weekday_int)
         days_ahead = target_weekday - effective_start.weekday()
         if days_ahead < 0:
             days_ahead += 7
-        
+
         first_class_date = effective_start + timedelta(days=days_ahead)
-        
-        # Pre-parse time strings
-        start_time_str = str(row['start_time_local']).strip()
-        end_time_str = str(row['end_time_local']).strip()
-        
-        # Generate all occurrences using date range
+
+        # Parse the time strings once per row instead of once per week
+        start_time = _parse_local_time(row.start_time_local)
+        end_time = _parse_local_time(row.end_time_local)
+        if start_time is None or end_time is None:
+            return []
+
+        # Build every weekly date in one range, combine with the parsed
+        # times, and localize the whole index in a single call so the
+        # DST-aware conversion is amortized across the term
+        dates = pd.date_range(first_class_date, term_end.date(), freq='7D')
+        if dates.empty:
+            return []
+
+        starts = pd.DatetimeIndex(
+            [datetime.combine(d, start_time) for d in dates.date]
+        ).tz_localize('US/Eastern', nonexistent='shift_forward', ambiguous='NaT').tz_convert('UTC')
+        ends = pd.DatetimeIndex(
+            [datetime.combine(d, end_time) for d in dates.date]
+        ).tz_localize('US/Eastern', nonexistent='shift_forward', ambiguous='NaT').tz_convert('UTC')
+
+        base = row._asdict()
         occurrences = []
-        current_date = first_class_date
-        
-        while current_date <= term_end.date():
-            # Create datetime objects
-            start_datetime = pd.to_datetime(f"{current_date.strftime('%Y-%m-%d')} {start_time_str}", errors='coerce')
-            end_datetime = pd.to_datetime(f"{current_date.strftime('%Y-%m-%d')} {end_time_str}", errors='coerce')
-            
-            if pd.notna(start_datetime) and pd.notna(end_datetime):
-                # Convert to UTC once
-                start_datetime = start_datetime.tz_localize('US/Eastern').tz_convert('UTC')
-                end_datetime = end_datetime.tz_localize('US/Eastern').tz_convert('UTC')
-                
-                # Create occurrence dictionary
-                occurrence = row.to_dict()
-                occurrence.update({
-                    'start': start_datetime,
-                    'end': end_datetime,
-                    'occurrence_date': current_date.strftime('%Y-%m-%d')
-                })
-                
-                occurrences.append(occurrence)
-            
-            # Move to next week
-            current_date += timedelta(days=7)
-        
+        for current_date, start_datetime, end_datetime in zip(dates.date, starts, ends):
+            if pd.isna(start_datetime) or pd.isna(end_datetime):
+                continue
+            occurrence = dict(base)
+            occurrence.update({
+                'start': start_datetime,
+                'end': end_datetime,
+                'occurrence_date': current_date.strftime('%Y-%m-%d')
+            })
+            occurrences.append(occurrence)
+
         return occurrences
-        
+
     except Exception:
         return []
 
-def format_cmu_location_optimized(studio: Any, campus_area: Any) -> str:
-    """Optimized CMU location formatting"""
-    parts = []
-    
-    if pd.notna(studio) and str(studio).strip():
-        parts.append(str(studio).strip())
-    
-    if pd.notna(campus_area) and str(campus_area).strip():
-        parts.append(f"({str(campus_area).strip()})")
-    
-    return ' '.join(parts) if parts else 'CMU Campus'
+def format_cmu_location_optimized(studio: pd.Series, campus_area: pd.Series) -> pd.Series:
+    """Optimized CMU location formatting over whole columns"""
+    studio = studio.fillna('').astype(str).str.strip()
+    area = campus_area.fillna('').astype(str).str.strip()
+    area = area.where(area.eq(''), '(' + area + ')')
+
+    combined = (studio + ' ' + area).str.strip()
+    return combined.where(combined.ne(''), 'CMU Campus')
 
 # ===========================
 # OPTIMIZED COMBINATION FUNCTION
 # ===========================
 
+# Shared empty skeleton so reruns with no data skip DataFrame construction
+_EMPTY_RESULT = pd.DataFrame(
+    columns=['time_range', 'start', 'end', 'scraped_event', 'calendar_event', 'description', 'location', 'url']
+)
+
 def standardize_and_combine_optimized(google_df: Optional[pd.DataFrame] = None, 
                                      webscrape_df: Optional[pd.DataFrame] = None, 
                                      cmu_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """Optimized version of standardize_and_combine with better performance"""
-    
+
+    # Short-circuit the common "nothing loaded yet" rerun
+    if all(df is None or df.empty for df in (google_df, webscrape_df, cmu_df)):
+        return _EMPTY_RESULT.copy()
+
     cleaned_dfs = []
     
     # Process each data source
@@ -324,9 +505,16 @@ def standardize_and_combine_optimized(google_df: Optional[pd.DataFrame] = None,
         (cmu_df, clean_cmu_scraper_df, 'scraped_event')
     ]
     
-    for df, clean_func, event_type in data_sources:
-        if df is not None and not df.empty:
-            cleaned = clean_func(df)
+    # The cleaners work on disjoint inputs and spend their time in
+    # GIL-releasing pandas ops, so run them in parallel
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            (executor.submit(clean_func, df), event_type)
+            for df, clean_func, event_type in data_sources
+            if df is not None and not df.empty
+        ]
+        for future, event_type in futures:
+            cleaned = future.result()
             if not cleaned.empty:
                 # Add the appropriate event type column
                 if event_type == 'calendar_event':
@@ -336,27 +524,24 @@ def standardize_and_combine_optimized(google_df: Optional[pd.DataFrame] = None,
                 cleaned_dfs.append(cleaned)
     
     if not cleaned_dfs:
-        return pd.DataFrame(columns=['time_range', 'scraped_event', 'calendar_event', 'description', 'location', 'url'])
+        return _EMPTY_RESULT.copy()
     
     # Combine all dataframes
     combined_df = pd.concat(cleaned_dfs, ignore_index=True)
     
-    # Create time ranges
-    combined_df['time_range'] = combined_df.apply(
-        lambda row: create_time_range_display(row['start'], row['end']), axis=1
-    )
-    
-    # Remove invalid rows
-    combined_df = combined_df.dropna(subset=['time_range'])
+    # Create time ranges for the whole frame at once
+    combined_df['time_range'] = create_time_range_displays(combined_df['start'], combined_df['end'])
     
-    # Sort by start time
-    combined_df = combined_df.sort_values('start').reset_index(drop=True)
+    # Mask invalid rows and sort without an intermediate reindex
+    combined_df = combined_df.loc[combined_df['time_range'].notna()] \
+        .sort_values('start', ignore_index=True)
     
     # Optimized overlap detection
     final_df = remove_overlapping_events_optimized(combined_df)
     
-    # Return final columns
-    return final_df[['time_range', 'scraped_event', 'calendar_event', 'description', 'location', 'url']]
+    # Return final columns — start/end stay in the output as typed
+    # datetimes so downstream charts never re-parse strings
+    return final_df[['time_range', 'start', 'end', 'scraped_event', 'calendar_event', 'description', 'location', 'url']]
 
 def remove_overlapping_events_optimized(df: pd.DataFrame) -> pd.DataFrame:
     """Optimized overlap detection using vectorized operations where possible"""
@@ -379,25 +564,37 @@ def remove_overlapping_events_optimized(df: pd.DataFrame) -> pd.DataFrame:
         scraped_events['start'] + timedelta(hours=1)
     )
     
-    # Find non-overlapping scraped events
-    non_overlapping_scraped = []
-    
-    for _, scraped in scraped_events.iterrows():
-        # Check overlap with all calendar events at once
-        overlaps = (
-            (calendar_events['start'] < scraped['end_filled']) & 
-            (scraped['start'] < calendar_events['end_filled'])
-        )
-        
-        if not overlaps.any():
-            non_overlapping_scraped.append(scraped)
-    
+    # Sort the calendar intervals once and answer every overlap query with
+    # a binary search instead of a full boolean mask per scraped row
+    cal_starts = calendar_events['start'].values.astype('int64')
+    cal_ends = calendar_events['end_filled'].values.astype('int64')
+    order = np.argsort(cal_starts)
+    cal_starts_sorted = cal_starts[order]
+    cal_ends_cummax = np.maximum.accumulate(cal_ends[order])
+
+    s_starts = scraped_events['start'].values.astype('int64')
+    s_ends = scraped_events['end_filled'].values.astype('int64')
+
+    # Only calendar events starting before a scraped end can overlap it;
+    # among those, the running max end says whether any reaches past the
+    # scraped start
+    idx = np.searchsorted(cal_starts_sorted, s_ends, side='left')
+    max_end_before = np.where(
+        idx > 0, cal_ends_cummax[np.maximum(idx - 1, 0)], np.iinfo(np.int64).min
+    )
+    overlaps = (idx > 0) & (max_end_before > s_starts)
+
+    non_overlapping_scraped = scraped_events[~overlaps]
+
     # Combine results
-    events_to_keep = [calendar_events] + ([pd.DataFrame(non_overlapping_scraped)] if non_overlapping_scraped else [])
+    events_to_keep = [calendar_events] + ([non_overlapping_scraped] if not non_overlapping_scraped.empty else [])
     
     if events_to_keep:
         result_df = pd.concat(events_to_keep, ignore_index=True)
-        result_df = result_df.sort_values('start').reset_index(drop=True)
+        # The caller hands us a frame already sorted by start and boolean
+        # indexing preserved that order in both halves, so a stable
+        # mergesort only interleaves two sorted runs instead of re-sorting
+        result_df = result_df.sort_values('start', kind='mergesort', ignore_index=True)
         # Remove the temporary column
         if 'end_filled' in result_df.columns:
             result_df = result_df.drop('end_filled', axis=1)
@@ -16,7 +16,41 @@ class FitnessRecommender:
             'max_classes_per_week': 5,
             'min_gap_hours': 1  # Minimum hours between classes
         }
-    
+        # Parsed calendar intervals, keyed by a fingerprint of the frame
+        self._calendar_cache = (None, None, None)
+        self._refresh_derived_preferences()
+
+    def _refresh_derived_preferences(self):
+        """Precompute hash-based lookups for the scoring hot path"""
+        self._pref_times = frozenset(self.preferences['preferred_times'])
+        self._pref_days = frozenset(self.preferences['preferred_days'])
+        self._class_types = tuple(s.lower() for s in self.preferences['class_types'])
+
+    def _calendar_arrays(self, calendar_df: pd.DataFrame):
+        """Parse the calendar start/end columns once per distinct frame.
+
+        Returns sorted int64-nanosecond arrays of the valid intervals and
+        caches them under a content fingerprint (shape, dtypes, row-hash
+        sum), so repeated scoring calls skip re-parsing every timestamp —
+        and a frame rebuilt with the same contents still hits. An object
+        identity key would be unsafe here: the recommender outlives any
+        one frame across Streamlit reruns and CPython recycles ids.
+        """
+        key = (calendar_df.shape, tuple(calendar_df.dtypes.astype(str)),
+               int(pd.util.hash_pandas_object(calendar_df, index=False).sum()))
+        if self._calendar_cache[0] != key:
+            if 'start' in calendar_df.columns and 'end' in calendar_df.columns:
+                cal_start = pd.to_datetime(calendar_df['start'], errors='coerce')
+                cal_end = pd.to_datetime(calendar_df['end'], errors='coerce')
+                ok = cal_start.notna() & cal_end.notna()
+                starts = np.sort(cal_start[ok].values.astype('int64'))
+                ends = np.sort(cal_end[ok].values.astype('int64'))
+            else:
+                starts = ends = np.empty(0, dtype='int64')
+            self._calendar_cache = (key, starts, ends)
+        return self._calendar_cache[1], self._calendar_cache[2]
+
+
     def set_preferences(self, preferred_times=None, preferred_days=None, 
                        class_types=None, max_classes_per_week=None, min_gap_hours=None):
         """Update user preferences"""
@@ -30,6 +64,7 @@ class FitnessRecommender:
             self.preferences['max_classes_per_week'] = max_classes_per_week
         if min_gap_hours:
             self.preferences['min_gap_hours'] = min_gap_hours
+        self._refresh_derived_preferences()
     
     def get_time_of_day(self, hour: int) -> str:
         """Categorize hour into time of day"""
@@ -56,40 +91,34 @@ class FitnessRecommender:
             return 0.0
         
         # Check time preference (40 points)
-        if time_of_day in self.preferences['preferred_times']:
+        if time_of_day in self._pref_times:
             score += 40
-        
+
         # Check day preference (30 points)
-        if day in self.preferences['preferred_days']:
+        if day in self._pref_days:
             score += 30
         
-        # Check for conflicts (penalty)
+        # Check for conflicts (penalty) against the cached calendar arrays
+        # instead of re-parsing every calendar timestamp per call
         if not calendar_df.empty and 'start' in calendar_df.columns:
             event_start = start_dt
             event_end = pd.to_datetime(event_row.get('end', event_start + timedelta(hours=1)))
-            
-            # Check for conflicts
-            conflicts = 0
-            for _, cal_event in calendar_df.iterrows():
-                if pd.notna(cal_event.get('start')) and pd.notna(cal_event.get('end')):
-                    cal_start = pd.to_datetime(cal_event['start'])
-                    cal_end = pd.to_datetime(cal_event['end'])
-                    
-                    # Check overlap
-                    if (event_start < cal_end) and (event_end > cal_start):
-                        conflicts += 1
-                        # Heavy penalty for conflicts
-                        score -= 50
-            
-            # Bonus for no conflicts
+
+            cal_starts, cal_ends = self._calendar_arrays(calendar_df)
+            s = pd.Timestamp(event_start).value
+            e = pd.Timestamp(event_end).value
+            conflicts = int(np.count_nonzero((cal_starts < e) & (cal_ends > s)))
+
+            # Heavy penalty for conflicts, bonus for none
+            score -= 50 * conflicts
             if conflicts == 0:
                 score += 20
         
-        # Check class type preference (20 points)
+        # Check class type preference (20 points) — patterns pre-lowercased
         event_name = str(event_row.get('scraped_event', '')).lower()
-        if self.preferences['class_types']:
-            for preferred_type in self.preferences['class_types']:
-                if preferred_type.lower() in event_name:
+        if self._class_types:
+            for preferred_type in self._class_types:
+                if preferred_type in event_name:
                     score += 20
                     break
         else:
@@ -106,20 +135,85 @@ class FitnessRecommender:
         
         return max(0, score)  # Ensure non-negative
     
-    def recommend_classes(self, fitness_df: pd.DataFrame, calendar_df: pd.DataFrame, 
+    def _score_vectorized(self, fitness_df: pd.DataFrame, calendar_df: pd.DataFrame) -> np.ndarray:
+        """Score every fitness class at once with column operations.
+
+        Same scoring rules as calculate_fitness_score, but hours/days/
+        time-of-day come from .dt accessors and conflict counts from a
+        searchsorted over the sorted calendar intervals instead of a
+        Python loop per class.
+        """
+        if 'start' in fitness_df.columns:
+            start = pd.to_datetime(fitness_df['start'], errors='coerce')
+        else:
+            start = pd.Series(pd.NaT, index=fitness_df.index)
+        valid = start.notna().to_numpy()
+
+        hour = start.dt.hour.fillna(-1).to_numpy()
+        day = start.dt.day_name().fillna('').to_numpy()
+        time_of_day = np.select(
+            [(hour >= 5) & (hour < 12), (hour >= 12) & (hour < 17), (hour >= 17) & (hour < 22)],
+            ['morning', 'afternoon', 'evening'],
+            default='night'
+        )
+
+        score = np.zeros(len(fitness_df))
+
+        # Time preference (40 points) and day preference (30 points)
+        score += 40 * np.isin(time_of_day, list(self._pref_times))
+        score += 30 * np.isin(day, list(self._pref_days))
+
+        # Conflict penalty / no-conflict bonus
+        if not calendar_df.empty and 'start' in calendar_df.columns:
+            if 'end' in fitness_df.columns:
+                end = pd.to_datetime(fitness_df['end'], errors='coerce')
+            else:
+                end = pd.Series(pd.NaT, index=fitness_df.index)
+            end = end.fillna(start + timedelta(hours=1))
+
+            # Overlap count = (#calendar starts before our end) minus
+            # (#calendar ends at/before our start), on the cached sorted arrays
+            cal_starts, cal_ends = self._calendar_arrays(calendar_df)
+            s = start.values.astype('int64')
+            e = end.values.astype('int64')
+            conflicts = np.maximum(
+                np.searchsorted(cal_starts, e, side='left')
+                - np.searchsorted(cal_ends, s, side='right'),
+                0
+            )
+
+            score -= 50 * conflicts
+            score += 20 * (conflicts == 0)
+
+        # Class type preference (20 points) or no-preference bonus
+        if 'scraped_event' in fitness_df.columns:
+            names = fitness_df['scraped_event'].fillna('').astype(str).str.lower()
+        else:
+            names = pd.Series('', index=fitness_df.index)
+        if self._class_types:
+            matched = np.zeros(len(fitness_df), dtype=bool)
+            for preferred_type in self._class_types:
+                matched |= names.str.contains(preferred_type, regex=False).to_numpy()
+            score += 20 * matched
+        else:
+            score += 10
+
+        # Morning and weekday bonuses
+        score += 10 * (time_of_day == 'morning')
+        score += 5 * np.isin(day, ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'])
+
+        # Classes without a valid start score 0, like the scalar path
+        return np.where(valid, np.maximum(score, 0), 0.0)
+
+    def recommend_classes(self, fitness_df: pd.DataFrame, calendar_df: pd.DataFrame,
                          top_n: int = 10) -> pd.DataFrame:
         """Get top N recommended fitness classes"""
         if fitness_df.empty:
             return pd.DataFrame()
-        
-        # Calculate scores for all fitness classes
-        scores = []
-        for _, row in fitness_df.iterrows():
-            score = self.calculate_fitness_score(row, calendar_df)
-            scores.append(score)
-        
+
+        # Score the whole frame at once instead of per-row Python calls
         fitness_df = fitness_df.copy()
-        fitness_df['recommendation_score'] = scores
+        fitness_df['recommendation_score'] = self._score_vectorized(fitness_df, calendar_df)
         
         # Filter out classes with zero or negative scores
         fitness_df = fitness_df[fitness_df['recommendation_score'] > 0]
@@ -137,68 +231,67 @@ class FitnessRecommender:
         
         # Get recommendations
         recommendations = self.recommend_classes(fitness_df, calendar_df, top_n=50)
-        
-        if recommendations.empty:
+
+        if recommendations.empty or 'start' not in recommendations.columns:
             return pd.DataFrame()
-        
-        # Group by week and day
-        optimal_schedule = []
-        selected_classes = set()
-        
-        # Get date range
-        if 'start' in recommendations.columns:
-            recommendations['start_dt'] = pd.to_datetime(recommendations['start'])
-            recommendations['week'] = recommendations['start_dt'].dt.isocalendar().week
-            recommendations['day'] = recommendations['start_dt'].dt.day_name()
-            
-            # Select best classes per day, respecting max_classes_per_week
-            for week in recommendations['week'].unique():
-                week_df = recommendations[recommendations['week'] == week]
-                week_classes = []
-                
-                for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']:
-                    day_df = week_df[week_df['day'] == day].sort_values('recommendation_score', ascending=False)
-                    
-                    for _, class_row in day_df.iterrows():
-                        class_id = f"{class_row.get('scraped_event', '')}_{class_row.get('start', '')}"
-                        
-                        if class_id not in selected_classes:
-                            # Check gap requirement
-                            if self._check_gap_requirement(class_row, week_classes):
-                                week_classes.append(class_row)
-                                selected_classes.add(class_id)
-                                
-                                if len(week_classes) >= self.preferences['max_classes_per_week']:
-                                    break
-                    
-                    if len(week_classes) >= self.preferences['max_classes_per_week']:
-                        break
-                
-                optimal_schedule.extend(week_classes)
-        
-        if optimal_schedule:
-            return pd.DataFrame(optimal_schedule)
+
+        recommendations['start_dt'] = pd.to_datetime(recommendations['start'], errors='coerce')
+        recommendations = recommendations.dropna(subset=['start_dt'])
+        recommendations['week'] = recommendations['start_dt'].dt.isocalendar().week
+        recommendations['day'] = recommendations['start_dt'].dt.day_name()
+
+        if 'end' in recommendations.columns:
+            end_dt = pd.to_datetime(recommendations['end'], errors='coerce')
         else:
-            return pd.DataFrame()
-    
-    def _check_gap_requirement(self, new_class: pd.Series, existing_classes: List) -> bool:
-        """Check if new class meets minimum gap requirement"""
-        if not existing_classes:
-            return True
-        
-        new_start = pd.to_datetime(new_class.get('start'))
-        min_gap = timedelta(hours=self.preferences['min_gap_hours'])
-        
-        for existing in existing_classes:
-            existing_start = pd.to_datetime(existing.get('start'))
-            existing_end = pd.to_datetime(existing.get('end', existing_start + timedelta(hours=1)))
-            
-            # Check if too close
-            if abs((new_start - existing_end).total_seconds()) < min_gap.total_seconds():
-                return False
-        
-        return True
-    
+            end_dt = pd.Series(pd.NaT, index=recommendations.index)
+        recommendations['_end_dt'] = end_dt.fillna(recommendations['start_dt'] + timedelta(hours=1))
+
+        weekday_pos = {day: i for i, day in enumerate(
+            ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])}
+        recommendations['_day_pos'] = recommendations['day'].map(weekday_pos)
+
+        max_per_week = self.preferences['max_classes_per_week']
+        min_gap_ns = np.int64(self.preferences['min_gap_hours'] * 3_600_000_000_000)
+
+        selected = []
+        selected_classes = set()
+
+        for _, week_df in recommendations.groupby('week', sort=False):
+            # Same policy as the row-wise version: walk the days in
+            # calendar order taking the best-scored classes first, allow
+            # several picks per day, and gap-check each candidate's start
+            # against the end of every class already kept this week
+            week_df = week_df.sort_values(['_day_pos', 'recommendation_score'],
+                                          ascending=[True, False])
+            starts_ns = week_df['start_dt'].values.astype('int64')
+            ends_ns = week_df['_end_dt'].values.astype('int64')
+            names = week_df.get('scraped_event', pd.Series('', index=week_df.index))
+            names = names.fillna('').astype(str).to_numpy()
+            raw_starts = week_df['start'].astype(str).to_numpy()
+
+            kept_pos = []
+            kept_ends = []
+            for pos in range(len(week_df)):
+                class_id = f"{names[pos]}_{raw_starts[pos]}"
+                if class_id in selected_classes:
+                    continue
+                s = starts_ns[pos]
+                if any(abs(s - e) < min_gap_ns for e in kept_ends):
+                    continue
+                kept_pos.append(pos)
+                kept_ends.append(ends_ns[pos])
+                selected_classes.add(class_id)
+                if len(kept_pos) >= max_per_week:
+                    break
+            if kept_pos:
+                selected.append(week_df.iloc[kept_pos])
+
+        if selected:
+            return (pd.concat(selected, ignore_index=True)
+                    .drop(columns=['_end_dt', '_day_pos']))
+        return pd.DataFrame()
+
+
     def get_schedule_insights(self, combined_df: pd.DataFrame) -> Dict[str, any]:
         """Generate insights about the schedule"""
         insights = {
@@ -7,35 +7,100 @@ import altair as alt
 import streamlit as st
 from datetime import datetime, timedelta
 import numpy as np
+import re
 
+_DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Common fitness class keywords
+fitness_keywords = {
+    'Yoga': ['yoga', 'vinyasa', 'yin', 'ashtanga'],
+    'Pilates': ['pilates', 'reformer'],
+    'Cardio': ['hiit', 'cardio', 'kickboxing', 'boxing', 'cycling', 'spin'],
+    'Strength': ['strength', 'weights', 'kettlebell', 'abs', 'glutes'],
+    'Dance': ['dance', 'hip hop', 'jazz', 'zumba'],
+    'Mindfulness': ['meditation', 'sound bath', 'mindfulness'],
+    'Barre': ['barre'],
+    'Other': []
+}
+
+# One compiled alternation per category, built once at import time
+_CATEGORY_PATTERNS = [
+    (category, re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE))
+    for category, keywords in fitness_keywords.items() if keywords
+]
+
+def _hash_df(df):
+    """Cheap cache key for st.cache_data: shape, dtypes and a row-hash sum
+    instead of pickling the whole frame"""
+    return (df.shape, tuple(df.dtypes.astype(str)),
+            int(pd.util.hash_pandas_object(df, index=False).sum()))
+
+_CACHE_KW = dict(show_spinner=False, hash_funcs={pd.DataFrame: _hash_df})
+
+@st.cache_data(**_CACHE_KW)
+def _build_viz_frame(df):
+    """Build the derived columns shared by the charts (day, hour, name,
+    category) in a single pass instead of once per chart"""
+    if 'start_dt' in df.columns:
+        start_dt = df['start_dt']
+    elif 'start' in df.columns:
+        start_dt = pd.to_datetime(df['start'])
+    else:
+        start_dt = pd.Series(pd.NaT, index=df.index)
+
+    names = pd.Series('', index=df.index)
+    for col in ['scraped_event', 'calendar_event']:
+        if col in df.columns:
+            names = names.where(names.ne(''), df[col].fillna(''))
+    names = names.astype(str)
+
+    conditions = [names.str.contains(pattern) for _, pattern in _CATEGORY_PATTERNS]
+    categories = [category for category, _ in _CATEGORY_PATTERNS]
+
+    # Categoricals group via integer codes instead of hashing strings;
+    # hours fit in a byte (nullable, so missing starts stay out of the
+    # groupbys like the float NaNs did)
+    return pd.DataFrame({
+        'day_of_week': pd.Categorical(start_dt.dt.day_name(), categories=_DAY_ORDER, ordered=True),
+        'hour': start_dt.dt.hour.astype('Int8'),
+        'event_name': names,
+        'category': pd.Categorical(
+            np.select(conditions, categories, default='Other'),
+            categories=list(fitness_keywords.keys())
+        )
+    })
+
+@st.cache_data(**_CACHE_KW)
 def create_timeline_chart(df, height=600):
     """Create an interactive timeline/Gantt chart of events"""
     if df.empty or 'start' not in df.columns:
         return None
     
-    # Prepare data for timeline
-    timeline_df = df.copy()
-    timeline_df['start_dt'] = pd.to_datetime(timeline_df['start'])
-    timeline_df['end_dt'] = pd.to_datetime(timeline_df['end'])
-    
-    # Calculate duration in hours
-    timeline_df['duration_hours'] = (timeline_df['end_dt'] - timeline_df['start_dt']).dt.total_seconds() / 3600
-    timeline_df['duration_hours'] = timeline_df['duration_hours'].fillna(1)  # Default 1 hour
-    
-    # Create event name
-    timeline_df['event_name'] = timeline_df.apply(
-        lambda row: row.get('calendar_event', '') or row.get('scraped_event', 'Untitled Event'),
-        axis=1
-    )
-    
-    # Create color based on source
-    timeline_df['source'] = timeline_df.apply(
-        lambda row: 'Calendar' if pd.notna(row.get('calendar_event')) else 'Fitness Class',
-        axis=1
-    )
-    
-    # Sort by start time
-    timeline_df = timeline_df.sort_values('start_dt')
+    # Reuse the pre-parsed columns when the caller provides them
+    start_dt = df['start_dt'] if 'start_dt' in df.columns else pd.to_datetime(df['start'])
+    end_dt = df['end_dt'] if 'end_dt' in df.columns else pd.to_datetime(df['end'])
+
+    # Create event name column-wise: first non-empty of the two sources
+    names = pd.Series('', index=df.index)
+    for col in ['calendar_event', 'scraped_event']:
+        if col in df.columns:
+            names = names.where(names.ne(''), df[col].fillna(''))
+
+    # Create color based on source, as a small fixed-vocabulary categorical
+    if 'calendar_event' in df.columns:
+        source = np.where(df['calendar_event'].notna(), 'Calendar', 'Fitness Class')
+    else:
+        source = np.full(len(df), 'Fitness Class')
+
+    # Hand Altair only the columns the chart encodes instead of copying
+    # the whole input frame
+    timeline_df = pd.DataFrame({
+        'start_dt': start_dt,
+        'end_dt': end_dt,
+        'event_name': names.replace('', 'Untitled Event'),
+        'source': pd.Categorical(source, categories=['Calendar', 'Fitness Class']),
+        'location': df['location'] if 'location' in df.columns else ''
+    }).sort_values('start_dt')
     
     # Create the chart
     chart = alt.Chart(timeline_df).mark_bar(
@@ -68,29 +133,25 @@ def create_timeline_chart(df, height=600):
     
     return chart
 
+@st.cache_data(**_CACHE_KW)
 def create_schedule_heatmap(df):
     """Create a heatmap showing schedule density by day of week and hour"""
     if df.empty or 'start' not in df.columns:
         return None
     
-    heatmap_df = df.copy()
-    heatmap_df['start_dt'] = pd.to_datetime(heatmap_df['start'])
-    heatmap_df['day_of_week'] = heatmap_df['start_dt'].dt.day_name()
-    heatmap_df['hour'] = heatmap_df['start_dt'].dt.hour
-    
-    # Count events per day/hour
-    heatmap_data = heatmap_df.groupby(['day_of_week', 'hour']).size().reset_index(name='count')
-    
-    # Order days
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    heatmap_data['day_of_week'] = pd.Categorical(heatmap_data['day_of_week'], categories=day_order, ordered=True)
-    
+    # Count events per day/hour on the shared derived frame; the day
+    # column is already an ordered Categorical, so the groupby comes back
+    # in day order without a separate reorder
+    heatmap_data = _build_viz_frame(df).groupby(
+        ['day_of_week', 'hour'], observed=True
+    ).size().reset_index(name='count')
+
     chart = alt.Chart(heatmap_data).mark_rect(
         stroke='white',
         strokeWidth=2
     ).encode(
         x=alt.X('hour:O', title='Hour of Day', axis=alt.Axis(labelAngle=0)),
-        y=alt.Y('day_of_week:O', title='Day of Week', sort=day_order),
+        y=alt.Y('day_of_week:O', title='Day of Week', sort=_DAY_ORDER),
         color=alt.Color('count:Q',
                        scale=alt.Scale(scheme='blues'),
                        legend=alt.Legend(title='Number of Events')),
@@ -107,42 +168,17 @@ def create_schedule_heatmap(df):
     
     return chart
 
+@st.cache_data(**_CACHE_KW)
 def create_class_type_chart(df):
     """Create a bar chart showing distribution of class types"""
     if df.empty:
         return None
     
-    # Extract class types from event names
-    class_df = df.copy()
-    class_df['event_name'] = class_df.apply(
-        lambda row: row.get('scraped_event', '') or row.get('calendar_event', ''),
-        axis=1
-    )
-    
-    # Common fitness class keywords
-    fitness_keywords = {
-        'Yoga': ['yoga', 'vinyasa', 'yin', 'ashtanga'],
-        'Pilates': ['pilates', 'reformer'],
-        'Cardio': ['hiit', 'cardio', 'kickboxing', 'boxing', 'cycling', 'spin'],
-        'Strength': ['strength', 'weights', 'kettlebell', 'abs', 'glutes'],
-        'Dance': ['dance', 'hip hop', 'jazz', 'zumba'],
-        'Mindfulness': ['meditation', 'sound bath', 'mindfulness'],
-        'Barre': ['barre'],
-        'Other': []
-    }
-    
-    def categorize_class(name):
-        name_lower = str(name).lower()
-        for category, keywords in fitness_keywords.items():
-            if category == 'Other':
-                continue
-            if any(keyword in name_lower for keyword in keywords):
-                return category
-        return 'Other'
-    
-    class_df['category'] = class_df['event_name'].apply(categorize_class)
-    category_counts = class_df['category'].value_counts().reset_index()
+    # Categories come precomputed from the shared derived frame; a
+    # categorical value_counts lists every category, so drop empty ones
+    category_counts = _build_viz_frame(df)['category'].value_counts().reset_index()
     category_counts.columns = ['Category', 'Count']
+    category_counts = category_counts[category_counts['Count'] > 0]
     
     chart = alt.Chart(category_counts).mark_bar(
         cornerRadius=5
@@ -159,16 +195,13 @@ def create_class_type_chart(df):
     
     return chart
 
+@st.cache_data(**_CACHE_KW)
 def create_time_distribution_chart(df):
     """Create a chart showing event distribution throughout the day"""
     if df.empty or 'start' not in df.columns:
         return None
     
-    time_df = df.copy()
-    time_df['start_dt'] = pd.to_datetime(time_df['start'])
-    time_df['hour'] = time_df['start_dt'].dt.hour
-    
-    hour_counts = time_df['hour'].value_counts().sort_index().reset_index()
+    hour_counts = _build_viz_frame(df)['hour'].value_counts().sort_index().reset_index()
     hour_counts.columns = ['Hour', 'Count']
     
     chart = alt.Chart(hour_counts).mark_area(
@@ -189,6 +222,7 @@ def create_time_distribution_chart(df):
     
     return chart
 
+@st.cache_data(**_CACHE_KW)
 def create_stats_cards(df):
     """Create metric cards for dashboard"""
     if df.empty:
@@ -203,30 +237,38 @@ def create_stats_cards(df):
     stats = {}
     stats['total_events'] = len(df)
     
-    # Count by source
-    calendar_count = df['calendar_event'].notna().sum()
-    fitness_count = df['scraped_event'].notna().sum()
-    
-    stats['calendar_events'] = calendar_count
-    stats['fitness_classes'] = fitness_count
+    # Count by source — count() is one C-level pass with no boolean mask
+    stats['calendar_events'] = int(df['calendar_event'].count())
+    stats['fitness_classes'] = int(df['scraped_event'].count())
     
     # Calculate free time slots (simplified - assumes 8am-10pm active hours)
     if 'start' in df.columns:
-        df['start_dt'] = pd.to_datetime(df['start'])
-        df['end_dt'] = pd.to_datetime(df['end'])
-        
-        # Get date range
-        min_date = df['start_dt'].min().date()
-        max_date = df['start_dt'].max().date()
-        days = (max_date - min_date).days + 1
-        
-        # Assume 14 hours of active time per day (8am-10pm)
-        total_hours = days * 14
-        booked_hours = (df['end_dt'] - df['start_dt']).dt.total_seconds().sum() / 3600
-        free_hours = total_hours - booked_hours
-        
-        stats['free_slots'] = max(0, int(free_hours))
-        stats['avg_per_day'] = round(stats['total_events'] / days, 1) if days > 0 else 0
+        start_dt = df['start_dt'] if 'start_dt' in df.columns else pd.to_datetime(df['start'])
+        end_dt = df['end_dt'] if 'end_dt' in df.columns else pd.to_datetime(df['end'])
+
+        # Date range, booked time and averages all come from one pass
+        # over the int64 nanosecond arrays instead of separate
+        # min()/max()/sum() calls on the datetime Series
+        start_ns = start_dt.values.astype('i8')
+        end_ns = end_dt.values.astype('i8')
+        start_ok = ~start_dt.isna().values
+        both_ok = start_ok & ~end_dt.isna().values
+
+        if start_ok.any():
+            valid_starts = start_ns[start_ok]
+            day_ns = 86_400_000_000_000
+            days = int(valid_starts.max() // day_ns - valid_starts.min() // day_ns) + 1
+
+            # Assume 14 hours of active time per day (8am-10pm),
+            # skipping rows without an end time
+            total_hours = days * 14
+            booked_hours = (end_ns[both_ok] - start_ns[both_ok]).sum() / 3.6e12
+
+            stats['free_slots'] = max(0, int(total_hours - booked_hours))
+            stats['avg_per_day'] = round(stats['total_events'] / days, 1) if days > 0 else 0
+        else:
+            stats['free_slots'] = 0
+            stats['avg_per_day'] = 0
     else:
         stats['free_slots'] = 0
         stats['avg_per_day'] = 0